@@ -0,0 +1,112 @@
+from typing import *
+from bisect import bisect_left, insort
+
+class AuthorBitmap:
+    """
+    Compressed set of non-negative author IDs, laid out like a roaring bitmap.
+    
+    IDs are split into a 16-bit high key and a 16-bit low value. Each high key owns one container:
+    a sorted list of low values while the container is sparse, or a 65536-bit bytearray bitset once it
+    holds more than ARRAY_LIMIT values. A bitset only goes back to a sorted list once it drops to half of that.
+    """
+    
+    ARRAY_LIMIT = 4096
+    
+    def __init__(self, ids: Iterable[int] = ()):
+        self.__containers: dict[int, Union[list[int], bytearray]] = {} # {high key: sorted lows or bitset, ...}
+        self.__sizes: dict[int, int] = {} # {high key: cardinality, ...}
+        
+        for id in ids:
+            self.add(id)
+    
+    def __repr__(self) -> str:
+        return f"AuthorBitmap({list(self)})"
+    
+    def __len__(self) -> int:
+        return sum(self.__sizes.values())
+    
+    def __iter__(self) -> Iterator[int]:
+        for high in sorted(self.__containers):
+            container = self.__containers[high]
+            base = high << 16
+            
+            if isinstance(container, list):
+                for low in container:
+                    yield base | low
+                continue
+            
+            for low in self.__bitset_lows(container):
+                yield base | low
+    
+    def __contains__(self, id: int) -> bool:
+        container = self.__containers.get(id >> 16, None)
+        if container is None:
+            return False
+        
+        low = id & 0xFFFF
+        if isinstance(container, list):
+            i = bisect_left(container, low)
+            return i < len(container) and container[i] == low
+        
+        return container[low >> 3] & (1 << (low & 7)) != 0
+    
+    @staticmethod
+    def __bitset_lows(bitset: bytearray) -> Iterator[int]:
+        """
+        Yields the low values set in a bitset container in ascending order, skipping empty bytes.
+        """
+        for i, byte in enumerate(bitset):
+            if byte == 0:
+                continue
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield (i << 3) | bit
+    
+    def add(self, id: int) -> None:
+        """
+        Adds an author ID to the bitmap.
+        """
+        assert isinstance(id, int), "Author id must be an integer"
+        assert id >= 0, "Author id must be non-negative"
+        
+        if id in self:
+            return
+        
+        high, low = id >> 16, id & 0xFFFF
+        container = self.__containers.setdefault(high, [])
+        self.__sizes[high] = self.__sizes.get(high, 0) + 1
+        
+        if isinstance(container, bytearray):
+            container[low >> 3] |= 1 << (low & 7)
+            return
+        
+        insort(container, low)
+        if len(container) > self.ARRAY_LIMIT: # dense enough that a bitset is smaller
+            bitset = bytearray(1 << 13)
+            for value in container:
+                bitset[value >> 3] |= 1 << (value & 7)
+            self.__containers[high] = bitset
+    
+    def discard(self, id: int) -> None:
+        """
+        Removes an author ID from the bitmap if it is present.
+        """
+        if id not in self:
+            return
+        
+        high, low = id >> 16, id & 0xFFFF
+        container = self.__containers[high]
+        self.__sizes[high] -= 1
+        
+        if self.__sizes[high] == 0:
+            del self.__containers[high]
+            del self.__sizes[high]
+            return
+        
+        if isinstance(container, list):
+            container.pop(bisect_left(container, low))
+            return
+        
+        container[low >> 3] &= ~(1 << (low & 7)) & 0xFF
+        if self.__sizes[high] <= self.ARRAY_LIMIT // 2: # well below the limit, so churn at the limit doesn't convert
+            self.__containers[high] = list(self.__bitset_lows(container))
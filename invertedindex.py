@@ -2,16 +2,17 @@ from typing import *
 from nltk.tokenize import word_tokenize
 from collections import Counter
 from post import Post
+from bitmap import AuthorBitmap
 
 class InvertedIndex:
     def __init__(self):
-        self.__index: dict[str, list[Post]] = {}
+        self.__index: dict[str, dict[int, list[Post]]] = {} # {word: {author id: [post, ...], ...}, ...}
     
     def __repr__(self) -> str:
         return f"InvertedIndex({self.__index})"
     
     def __str__(self) -> str:
-        return str([f"{term}: {posts}" for term, posts in self.__index.items()])
+        return str([f"{term}: {[post for posts in runs.values() for post in posts]}" for term, runs in self.__index.items()])
     
     def __tokenize(self, content: str) -> list[str]:
         return word_tokenize(content.casefold())
@@ -23,37 +24,52 @@ class InvertedIndex:
         content = self.__tokenize(post.content())
         
         for word in content:
-            if word not in self.__index:
-                self.__index[word] = [post]
+            runs = self.__index.setdefault(word, {})
+            if post.user_id() not in runs:
+                runs[post.user_id()] = [post]
                 continue
-            self.__index[word].append(post)
+            runs[post.user_id()].append(post)
     
-    def __keyword_search(self, keyword: str) -> list[Post]:
+    def __keyword_search(self, keyword: str) -> dict[int, list[Post]]:
         """
-        Returns a list of posts that contain the given keyword.
+        Returns the posts that contain the given keyword, grouped by author id.
         """
         
         keyword = self.__normalize(keyword)
-        return self.__index.get(keyword, [])
+        return self.__index.get(keyword, {})
 
-    def search(self, query: str, top_k: int = None) -> list[Post]:
+    def search(self, query: str, top_k: int = None, authors: AuthorBitmap = None,
+               boosted: AuthorBitmap = None, boost: int = 2) -> list[Post]:
         """
         Returns a list of posts that match the given query.
+        
+        If authors is given, only the postings of authors in the bitmap are walked, so posts by other authors
+        are never visited.
+        If boosted is given, the score of posts whose author id is in the bitmap is multiplied by boost.
+        Posts with equal scores keep the order they were indexed in.
         """
         
         assert isinstance(query, str), "Query must be a string"
 
-        keywords = self.__tokenize(query)
-        keyword_sets = [set(self.__keyword_search(keyword)) for keyword in keywords]
-        all_posts = list(set.union(*keyword_sets)) # all posts that contain one or more of the keywords
+        keywords = set(self.__tokenize(query))
 
+        # a post is posted once per occurrence of a term, so summing postings gives the number of
+        # the post's words that are in the query
         scored_posts: Counter[Post, int] = Counter()
-        for post in all_posts:
-            post_keywords = self.__tokenize(post.content())
+        for keyword in keywords:
+            runs = self.__keyword_search(keyword)
+            
+            if authors is None:
+                matching = runs.items()
+            elif len(authors) < len(runs): # look up each followed author's run
+                matching = [(author, runs[author]) for author in authors if author in runs]
+            else: # fewer authors used the term than are followed, test each run instead
+                matching = [(author, posts) for author, posts in runs.items() if author in authors]
             
-            for post_keyword in post_keywords:
-                if post_keyword in keywords:
-                    scored_posts[post] += 1
+            for author, posts in matching:
+                weight = boost if boosted is not None and author in boosted else 1
+                for post in posts:
+                    scored_posts[post] += weight
 
         scored_posts = scored_posts.most_common(top_k)
         results = [post for (post, _) in scored_posts]
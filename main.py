@@ -8,8 +8,9 @@ import os
 def search(system: System, current_user: User):
     print("Search menu")
     print("  1. Search for post")
-    print("  2. Search for user")
-    print("  3. Back")
+    print("  2. Search for post from people you follow")
+    print("  3. Search for user")
+    print("  4. Back")
     option = input("> ")
     os.system("clear")
     
@@ -17,7 +18,7 @@ def search(system: System, current_user: User):
         case "1": # Search for post
             print("Search for post")
             query = input("> ")
-            results = system.search(query)
+            results = system.search(query, user=current_user)
             
             print()
             post: Post
@@ -25,7 +26,18 @@ def search(system: System, current_user: User):
                 print(f"https://rdSocial.com/post/{post.id()}/\n@{post.user_handle()}: {post.content()}")
                 print()
         
-        case "2": # Search for user
+        case "2": # Search for post from people you follow
+            print("Search for post from people you follow")
+            query = input("> ")
+            results = system.search_following(query, current_user)
+            
+            print()
+            post: Post
+            for post in results:
+                print(f"https://rdSocial.com/post/{post.id()}/\n@{post.user_handle()}: {post.content()}")
+                print()
+        
+        case "3": # Search for user
             print("Search for user")
             query = input("> ")
             results: list[User] = system.search_users(query, top_k=5)
@@ -53,7 +65,7 @@ def search(system: System, current_user: User):
                 current_user.follow(system, user.handle())
                 print(f"Now following {user.name()}!")
             
-        case "3": # Back
+        case "4": # Back
             return
         case _:
             print("Invalid option")
@@ -6,6 +6,7 @@ class Post:
     def __init__(self, id: int, user: "User", content: str):
         self.__id = id
         self.__user_handle = user.handle()
+        self.__user_id = user.id()
         self.__content = content
     
     def __str__(self):
@@ -24,4 +25,7 @@ class Post:
         return self.__content
     
     def user_handle(self) -> str:
-        return self.__user_handle
\ No newline at end of file
+        return self.__user_handle
+    
+    def user_id(self) -> int:
+        return self.__user_id
\ No newline at end of file
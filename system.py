@@ -9,7 +9,8 @@ class System:
     def __init__(self):
         self.__users: dict[str, User] = {} # {handle: User instance, ...}
         self.__posts: dict[int, Post] = {} # {id: post, ...}
-        self.__index: InvertedIndex = InvertedIndex() # {word: [post, ...], ...}
+        self.__index: InvertedIndex = InvertedIndex() # {word: {author id: [post, ...], ...}, ...}
+        self.__next_user_id: int = 0 # author ids are never reused, so postings of deleted users can't match new users
     
     def get_post(self, post_id: int) -> Post:
         return self.__posts.get(post_id, None)
@@ -57,12 +58,30 @@ class System:
         del self.__posts[post_id]
         user.remove_post(post_id)
     
-    def search(self, query: str, top_k: int = None) -> list[Post]:
+    def search(self, query: str, top_k: int = None, user: User = None) -> list[Post]:
         """
         Returns a list of posts that match the given query.
+        If a user is given, posts from users they follow are ranked higher.
         """
         
-        return self.__index.search(query, top_k)
+        if user is None:
+            return self.__index.search(query, top_k)
+        
+        assert isinstance(user, User), "User must be a User"
+        
+        return self.__index.search(query, top_k, boosted=user.following_ids())
+    
+    def search_following(self, query: str, user: User, top_k: int = None) -> list[Post]:
+        """
+        Returns a list of posts that match the given query, only from users that the given user follows.
+        """
+        
+        assert isinstance(user, User), "User must be a User"
+        
+        if len(user.following_ids()) == 0:
+            return []
+        
+        return self.__index.search(query, top_k, authors=user.following_ids())
     
     def __user_keyword_search(self, keyword: str) -> list[User]:
         """
@@ -110,7 +129,8 @@ class System:
         if name is None:
             raise ValueError("User must have a name")
         
-        new_user = User(handle, name)
+        new_user = User(handle, name, self.__next_user_id)
+        self.__next_user_id += 1
         self.__users[handle] = new_user
         return new_user
     
@@ -189,7 +209,7 @@ class System:
         follower: User
         followee: User
         
-        follower.add_following(followee.handle())
+        follower.add_following(followee.handle(), followee.id())
         followee.add_follower(follower.handle())
     
     def unfollow(self, follower_handle: str, followee_handle: str) -> None:
@@ -207,7 +227,7 @@ class System:
         follower: User
         followee: User
         
-        follower.remove_following(followee.handle())
+        follower.remove_following(followee.handle(), followee.id())
         followee.remove_follower(follower.handle())
     
     def delete_user(self, user_handle: str) -> None:
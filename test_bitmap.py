@@ -0,0 +1,70 @@
+from bitmap import AuthorBitmap
+
+
+def test_add_and_contains():
+    bitmap = AuthorBitmap([5, 1, 3, 3])
+    
+    assert len(bitmap) == 3
+    assert list(bitmap) == [1, 3, 5]
+    assert 3 in bitmap
+    assert 4 not in bitmap
+
+
+def test_converts_to_bitset_above_array_limit():
+    ids = list(range(0, 2 * (AuthorBitmap.ARRAY_LIMIT + 1), 2)) # ARRAY_LIMIT + 1 ids under one high key
+    bitmap = AuthorBitmap(ids)
+    
+    assert len(bitmap) == AuthorBitmap.ARRAY_LIMIT + 1
+    assert list(bitmap) == ids
+    assert all(id in bitmap for id in ids)
+    assert 1 not in bitmap
+    
+    bitmap.add(1)
+    assert 1 in bitmap
+    assert len(bitmap) == AuthorBitmap.ARRAY_LIMIT + 2
+
+
+def test_churn_at_array_limit():
+    ids = list(range(AuthorBitmap.ARRAY_LIMIT + 1))
+    bitmap = AuthorBitmap(ids)
+    
+    for _ in range(3): # stays a bitset, so every discard/add keeps the contents intact
+        bitmap.discard(0)
+        assert 0 not in bitmap
+        assert len(bitmap) == AuthorBitmap.ARRAY_LIMIT
+        
+        bitmap.add(0)
+        assert 0 in bitmap
+        assert list(bitmap) == ids
+
+
+def test_converts_back_to_array_on_discard():
+    ids = list(range(AuthorBitmap.ARRAY_LIMIT + 2))
+    bitmap = AuthorBitmap(ids)
+    
+    bitmap.discard(0)
+    bitmap.discard(0) # discarding a missing id is a no-op
+    for id in range(2, AuthorBitmap.ARRAY_LIMIT // 2 + 3): # drops to ARRAY_LIMIT // 2, back to a sorted array
+        bitmap.discard(id)
+    
+    remaining = [1] + ids[AuthorBitmap.ARRAY_LIMIT // 2 + 3:]
+    assert len(bitmap) == AuthorBitmap.ARRAY_LIMIT // 2
+    assert list(bitmap) == remaining
+    assert 0 not in bitmap and 2 not in bitmap
+    
+    bitmap.add(2)
+    bitmap.discard(1)
+    assert list(bitmap) == [2] + remaining[1:]
+
+
+def test_ids_across_high_keys():
+    ids = [3, 1 << 16, (1 << 16) + 5, (5 << 16) + 0xFFFF, 1 << 20]
+    bitmap = AuthorBitmap(reversed(ids))
+    
+    assert list(bitmap) == ids
+    assert (2 << 16) not in bitmap
+    
+    for id in ids:
+        bitmap.discard(id)
+    assert len(bitmap) == 0
+    assert list(bitmap) == []
@@ -0,0 +1,101 @@
+import pytest
+
+pytest.importorskip("nltk")
+
+from nltk.tokenize import word_tokenize, wordpunct_tokenize
+import invertedindex
+import system as system_module
+from system import System
+from user import User
+
+
+@pytest.fixture(autouse=True)
+def tokenizer(monkeypatch):
+    """
+    word_tokenize needs NLTK's punkt data. Where it hasn't been downloaded, fall back to NLTK's
+    wordpunct_tokenize, which needs no data and splits the plain posts below the same way.
+    """
+    try:
+        word_tokenize("probe")
+    except LookupError:
+        monkeypatch.setattr(invertedindex, "word_tokenize", wordpunct_tokenize)
+        monkeypatch.setattr(system_module, "word_tokenize", wordpunct_tokenize)
+
+
+def make_system(handles: list[str]) -> System:
+    return System.process_users(System(), [(handle, handle.upper()) for handle in handles])
+
+
+def test_following_stays_in_sync_with_bitmap():
+    user = User("a", "A", 0)
+    
+    user.add_following("b", 1)
+    user.add_following("b", 1)
+    assert user.following() == ["b"]
+    assert list(user.following_ids()) == [1]
+    
+    user.remove_following("b", 1)
+    assert user.following() == []
+    assert list(user.following_ids()) == []
+
+
+def test_search_following_matches_search_when_following_everyone():
+    system = make_system(["a", "b", "c", "d"])
+    system.add_post("I live in Oslo and I love Oslo", system.user("b"))
+    system.add_post("I live in Larvik", system.user("c"))
+    system.add_post("Oslo is nice", system.user("d"))
+    system.add_post("Oslo", system.user("a"))
+    
+    for handle in ("b", "c", "d"):
+        system.follow("a", handle)
+    
+    user = system.user("a")
+    everyone_else = [post for post in system.search("live oslo") if post.user_handle() != "a"]
+    
+    assert set(system.search_following("live oslo", user)) == set(everyone_else)
+    assert system.search_following("live oslo", user)[0].user_handle() == "b"
+
+
+def test_search_following_skips_unfollowed_authors():
+    handles = ["a", "b", "c", "d", "e", "f", "g", "h"]
+    system = make_system(handles)
+    for handle in handles:
+        system.add_post(f"Oslo from {handle}", system.user(handle))
+    
+    system.follow("a", "b")
+    system.follow("a", "c")
+    system.unfollow("a", "c")
+    system.follow("a", "d")
+    
+    user = system.user("a")
+    results = system.search_following("oslo", user) # more authors used "oslo" than a follows
+    
+    assert sorted(post.user_handle() for post in results) == ["b", "d"]
+    assert system.search_following("larvik", user) == []
+    assert system.search_following("oslo", system.user("e")) == [] # follows no one
+
+
+def test_search_boosts_followed_authors():
+    system = make_system(["a", "b", "c"])
+    system.add_post("Oslo", system.user("b"))
+    system.add_post("Oslo", system.user("c"))
+    system.follow("a", "c")
+    
+    assert [post.user_handle() for post in system.search("oslo")] == ["b", "c"] # tie keeps indexing order
+    assert [post.user_handle() for post in system.search("oslo", user=system.user("a"))] == ["c", "b"]
+
+
+def test_boost_weighs_followed_matches():
+    system = make_system(["a", "b", "c"])
+    b_post = system.get_post(system.add_post("Oslo Oslo", system.user("b")))
+    c_post = system.get_post(system.add_post("Oslo", system.user("c")))
+    system.follow("a", "c")
+    
+    index = invertedindex.InvertedIndex()
+    index.index_post(b_post)
+    index.index_post(c_post)
+    boosted = system.user("a").following_ids()
+    
+    assert index.search("oslo", boosted=boosted, boost=3) == [c_post, b_post]
+    # with the default boost of 2, one followed match ties two unfollowed ones and indexing order decides
+    assert index.search("oslo", boosted=boosted) == [b_post, c_post]
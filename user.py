@@ -1,12 +1,15 @@
 from typing import *
+from bitmap import AuthorBitmap
 
 class User:
-    def __init__(self, handle: str, name: str):
+    def __init__(self, handle: str, name: str, id: int):
         self.__handle: str = handle # unique identifier
         self.__name: str = name
+        self.__id: int = id # dense author id, used as the author column in the inverted index
         
         self.__followers: list[str] = [] # list of follower user handles in system.__users
         self.__following: list[str] = [] # list of following user handles in system.__users
+        self.__following_ids: AuthorBitmap = AuthorBitmap() # author ids of the users in self.__following
         
         self.__posts: set[int] = set() # list of post ids in system.__posts
     
@@ -28,6 +31,9 @@ class User:
     def handle(self):
         return self.__handle
     
+    def id(self) -> int:
+        return self.__id
+    
     def delete_user(self, system) -> None:
         system.delete_user(self.handle())
     
@@ -41,6 +47,10 @@ class User:
         """Returns the user's following in the form of handles."""
         return self.__following
     
+    def following_ids(self) -> AuthorBitmap:
+        """Returns the user's following in the form of a bitmap of author ids."""
+        return self.__following_ids
+    
     def follower_amount(self) -> int:
         """Returns the number of followers the user has."""
         return len(self.__followers)
@@ -51,15 +61,23 @@ class User:
         """
         assert isinstance(follower, str), "Follower handle must be a string"
         
+        if follower in self.__followers: # already following, keeps followers in sync with the follower's following
+            return
+        
         self.__followers.append(follower)
     
-    def add_following(self, following: str):
+    def add_following(self, following: str, following_id: int):
         """
-        Adds a following to the user's following in the form of a handle into the system's self.__users dictionary.
+        Adds a following to the user's following in the form of a handle into the system's self.__users dictionary,
+        and its author id to the user's following bitmap.
         """
         assert isinstance(following, str), "Following handle must be a string"
         
+        if following in self.__following: # already following, keeps self.__following in sync with the bitmap
+            return
+        
         self.__following.append(following)
+        self.__following_ids.add(following_id)
     
     def remove_follower(self, follower: str):
         """
@@ -69,13 +87,15 @@ class User:
         
         self.__followers.remove(follower)
     
-    def remove_following(self, following: str):
+    def remove_following(self, following: str, following_id: int):
         """
-        Removes a following from the user's following in the form of a handle into the system's self.__users dictionary.
+        Removes a following from the user's following in the form of a handle into the system's self.__users dictionary,
+        and its author id from the user's following bitmap.
         """
         assert isinstance(following, str), "Following handle must be a string"
         
         self.__following.remove(following)
+        self.__following_ids.discard(following_id)
     
     def follow(self, system, user: "User") -> None:
         """